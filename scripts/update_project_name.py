@@ -14,6 +14,8 @@ from typing import NamedTuple
 
 logger = logging.getLogger(__name__)
 
+_IDENT_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
 
 class ReplacementStats(NamedTuple):
     """Statistics for replacements made in a file."""
@@ -82,26 +84,32 @@ def update_file_contents(
     logger.debug(f"Processing file: {path}")
 
     try:
-        # Read file content
-        content = path.read_text(encoding="utf-8")
+        # Work on raw bytes so the result never has to be re-encoded. Byte
+        # matches equal text matches only for valid UTF-8, so still reject
+        # other encodings here (raises UnicodeDecodeError, as read_text did)
+        content = path.read_bytes()
+        content.decode("utf-8")
         total_replacements = 0
 
+        # Encode each pair once up front
+        encoded = [(old.encode(), new.encode()) for old, new in replacements]
+
         # Apply each replacement
-        for old_str, new_str in replacements:
-            if old_str in content:
-                replacement_count = content.count(old_str)
-                content = content.replace(old_str, new_str)
+        for (old_str, new_str), (old_bytes, new_bytes) in zip(
+            replacements, encoded, strict=True
+        ):
+            # count() already reports absence, so no separate membership test
+            replacement_count = content.count(old_bytes)
+            if replacement_count:
+                content = content.replace(old_bytes, new_bytes)
                 total_replacements += replacement_count
-
-                if replacement_count > 0:
-                    logger.debug(
-                        f"  Replaced '{old_str}' -> '{new_str}' "
-                        f"({replacement_count} times)"
-                    )
+                logger.debug(
+                    f"  Replaced '{old_str}' -> '{new_str}' ({replacement_count} times)"
+                )
 
         # Write back if changes were made and not in dry-run mode
         if total_replacements > 0 and not dry_run:
-            path.write_text(content, encoding="utf-8")
+            path.write_bytes(content)
             logger.info(f"✅ Replaced {total_replacements} occurrences in {path}")
         elif total_replacements > 0 and dry_run:
             logger.info(
@@ -131,7 +139,7 @@ def rename_directory(
     Returns:
         True if directory was renamed (or would be renamed in dry-run), False otherwise
     """
-    if not path.exists() or not path.is_dir():
+    if not path.is_dir():
         logger.debug(f"Directory {path} does not exist or is not a directory")
         return False
 
@@ -173,7 +181,7 @@ def find_target_files(project_root: Path) -> list[Path]:
     ]
 
     for candidate in candidates:
-        if candidate.exists() and candidate.is_file():
+        if candidate.is_file():
             target_files.append(candidate)
             logger.debug(f"Added target file: {candidate}")
         else:
@@ -228,7 +236,7 @@ Examples:
     logger.debug(f"Project root: {project_root}")
 
     # Validate inputs
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", args.new_name):
+    if not _IDENT_RE.match(args.new_name):
         logger.error(
             f"❌ Invalid project name '{args.new_name}'. "
             f"Must be a valid Python identifier."
@@ -1,3 +1,7 @@
-from .core.text_processor import SimpleTextProcessor
+from .core.text_processor import (
+    SimpleTextProcessor,
+    count_file_tokens,
+    iter_file_tokens,
+)
 
-__all__ = ["SimpleTextProcessor"]
+__all__ = ["SimpleTextProcessor", "count_file_tokens", "iter_file_tokens"]
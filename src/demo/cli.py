@@ -2,7 +2,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from .core.text_processor import SimpleTextProcessor
+from .core.text_processor import SimpleTextProcessor, count_file_tokens
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -39,19 +39,15 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def get_text_input(text: str | None, file: Path | None) -> str:
-    """Get text input from either text argument or file.
+def check_text_input(text: str | None, file: Path | None) -> None:
+    """Check that exactly one of text argument or file is provided.
 
     Args:
         text: Direct text input
         file: File path to read text from
 
-    Returns:
-        Text content
-
     Raises:
         ValueError: If both or neither text and file are provided
-        FileNotFoundError: If file doesn't exist
     """
     if text and file:
         raise ValueError("Cannot specify both text and file")
@@ -59,21 +55,35 @@ def get_text_input(text: str | None, file: Path | None) -> str:
     if not text and not file:
         raise ValueError("Must specify either text or file")
 
-    if file:
-        try:
-            return file.read_text(encoding="utf-8")
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"File not found: {file}") from e
 
-    return text  # type: ignore[return-value]
+def count_file_input(file: Path, word: str | None = None) -> int:
+    """Count tokens in a file without loading it whole.
+
+    Args:
+        file: File path to read text from
+        word: If given, count only tokens equal to this word
+
+    Returns:
+        Number of matching tokens
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    try:
+        return count_file_tokens(file, word)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file}") from e
 
 
 def cmd_count(args: argparse.Namespace) -> int:
     """Handle the count command."""
     try:
-        text = get_text_input(args.text, args.file)
-        processor = SimpleTextProcessor(text)
-        count = processor.count_words()
+        check_text_input(args.text, args.file)
+        if args.file:
+            count = count_file_input(args.file)
+        else:
+            processor = SimpleTextProcessor(args.text)
+            count = processor.count_words()
 
         print(count)
         logger.info("Count command completed", word_count=count)
@@ -88,9 +98,12 @@ def cmd_count(args: argparse.Namespace) -> int:
 def cmd_freq(args: argparse.Namespace) -> int:
     """Handle the freq command."""
     try:
-        text = get_text_input(args.text, args.file)
-        processor = SimpleTextProcessor(text)
-        frequency = processor.word_frequency(args.word)
+        check_text_input(args.text, args.file)
+        if args.file:
+            frequency = count_file_input(args.file, args.word)
+        else:
+            processor = SimpleTextProcessor(args.text)
+            frequency = processor.word_frequency(args.word)
 
         print(frequency)
         logger.info("Frequency command completed", word=args.word, frequency=frequency)
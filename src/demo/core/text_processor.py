@@ -1,10 +1,19 @@
+import logging
 import re
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
 
 from ..utils.logging_config import get_logger
 from ..utils.profiling import profile
 
 logger = get_logger(__name__)
 
+_TAB_RE = re.compile(r"\t+")
+_CHUNK_SIZE = 1 << 20
+# Maps every ASCII byte that str.split() treats as whitespace to a space
+_ASCII_WS_TO_SPACE = bytes.maketrans(b"\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f", b" " * 9)
+
 
 class SimpleTextProcessor:
     """Simple text processing utility for demonstrating TDD best practices."""
@@ -15,28 +24,48 @@ class SimpleTextProcessor:
         Args:
             text: Raw input text to process
         """
-        self.text = text
-        logger.info("SimpleTextProcessor initialized", text_length=len(text))
+        self._text = text
+        self._preprocessed: str | None = None
+        self._tokens: list[str] | None = None
+        self._freq: Counter[str] | None = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("SimpleTextProcessor initialized", text_length=len(text))
+
+    @property
+    def text(self) -> str:
+        """Raw input text; read-only because derived results are cached."""
+        return self._text
 
     def preprocess(self) -> str:
         """Preprocess text by stripping whitespace and converting tabs to spaces.
 
+        The result is cached on the instance; ``text`` is read-only, so the
+        cache cannot go stale.
+
         Returns:
             Preprocessed text
         """
+        if self._preprocessed is not None:
+            return self._preprocessed
+
         try:
             # Strip leading/trailing whitespace
             result = self.text.strip()
 
-            # Convert tabs to single spaces
-            result = re.sub(r"\t+", " ", result)
+            # Convert tabs to single spaces; only runs of tabs need the regex
+            if "\t\t" in result:
+                result = _TAB_RE.sub(" ", result)
+            elif "\t" in result:
+                result = result.replace("\t", " ")
 
-            logger.info(
-                "Text preprocessed",
-                original_length=len(self.text),
-                processed_length=len(result),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Text preprocessed",
+                    original_length=len(self.text),
+                    processed_length=len(result),
+                )
 
+            self._preprocessed = result
             return result
 
         except Exception as e:
@@ -44,29 +73,35 @@ class SimpleTextProcessor:
             raise
 
     def tokenize(self) -> list[str]:
-        """Tokenize preprocessed text by splitting on whitespace.
+        """Tokenize text by splitting on runs of whitespace.
 
         Returns:
             List of tokens (words)
         """
-        try:
-            # First preprocess the text
-            preprocessed = self.preprocess()
-
-            # Handle empty string case
-            if not preprocessed:
-                logger.info("Tokenized empty text", token_count=0)
-                return []
+        return list(self._get_tokens())
 
-            # Split on one or more whitespace characters
-            tokens = re.split(r"\s+", preprocessed)
+    def _get_tokens(self) -> list[str]:
+        """Return the cached token list, tokenizing on first use.
 
-            logger.info(
-                "Text tokenized",
-                token_count=len(tokens),
-                sample_tokens=tokens[:3] if len(tokens) > 0 else [],
-            )
+        Returns:
+            Shared list of tokens; callers must not mutate it
+        """
+        if self._tokens is not None:
+            return self._tokens
 
+        try:
+            # str.split() with no separator splits on runs of whitespace and
+            # drops leading/trailing whitespace, so preprocess() is not needed
+            tokens = self.text.split()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Text tokenized",
+                    token_count=len(tokens),
+                    sample_tokens=tokens[:3] if len(tokens) > 0 else [],
+                )
+
+            self._tokens = tokens
             return tokens
 
         except Exception as e:
@@ -81,12 +116,15 @@ class SimpleTextProcessor:
             Number of words (tokens) in the text
         """
         try:
-            tokens = self.tokenize()
+            tokens = self._get_tokens()
             count = len(tokens)
 
-            logger.info(
-                "Word count completed", word_count=count, input_length=len(self.text)
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Word count completed",
+                    word_count=count,
+                    input_length=len(self.text),
+                )
 
             return count
 
@@ -110,15 +148,22 @@ class SimpleTextProcessor:
             if not isinstance(word, str):
                 raise TypeError(f"Expected str, got {type(word).__name__}")
 
-            tokens = self.tokenize()
-            frequency = tokens.count(word)
+            # Tokens are never empty, and empty text has no tokens
+            if not word or not self.text:
+                return 0
 
-            logger.info(
-                "Word frequency calculated",
-                word=word,
-                frequency=frequency,
-                total_tokens=len(tokens),
-            )
+            tokens = self._get_tokens()
+            if self._freq is None:
+                self._freq = Counter(tokens)
+            frequency = self._freq.get(word, 0)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Word frequency calculated",
+                    word=word,
+                    frequency=frequency,
+                    total_tokens=len(tokens),
+                )
 
             return frequency
 
@@ -127,3 +172,82 @@ class SimpleTextProcessor:
                 "Error during word frequency calculation", error=str(e), word=word
             )
             raise
+
+
+def _iter_file_chunks(path: Path) -> Iterator[bytes]:
+    """Read a file in chunks of about 1 MiB that never cut through a token.
+
+    ASCII whitespace is normalised to spaces and each chunk ends after its
+    last space; the partial token behind it is carried into the next chunk.
+    ASCII bytes never occur inside a multi-byte UTF-8 sequence, so every chunk
+    can be decoded on its own.
+
+    Args:
+        path: File to read
+
+    Yields:
+        Whitespace-delimited chunks of the raw file bytes
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    pending: list[bytes] = []
+    with path.open("rb") as f:
+        while block := f.read(_CHUNK_SIZE):
+            block = block.translate(_ASCII_WS_TO_SPACE)
+            cut = block.rfind(b" ") + 1
+            if not cut:
+                pending.append(block)
+                continue
+            pending.append(block[:cut])
+            yield b"".join(pending)
+            pending = [block[cut:]]
+
+    tail = b"".join(pending)
+    if tail:
+        yield tail
+
+
+def iter_file_tokens(path: Path) -> Iterator[str]:
+    """Yield the tokens of a UTF-8 file without loading it into memory.
+
+    Args:
+        path: File to read tokens from
+
+    Yields:
+        Tokens (words) in file order, split as ``SimpleTextProcessor`` does
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    for chunk in _iter_file_chunks(path):
+        yield from chunk.decode("utf-8").split()
+
+
+def count_file_tokens(path: Path, word: str | None = None) -> int:
+    """Count the tokens of a UTF-8 file without loading it into memory.
+
+    Args:
+        path: File to read tokens from
+        word: If given, count only tokens equal to this word (case-sensitive)
+
+    Returns:
+        Number of matching tokens
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    target = None if word is None else word.encode("utf-8")
+    count = 0
+    for chunk in _iter_file_chunks(path):
+        # ASCII chunks are counted as bytes; only chunks with non-ASCII bytes
+        # are decoded, since they may contain non-ASCII whitespace (U+00A0)
+        if chunk.isascii():
+            byte_tokens = chunk.split()
+            count += len(byte_tokens) if target is None else byte_tokens.count(target)
+        else:
+            tokens = chunk.decode("utf-8").split()
+            count += len(tokens) if word is None else tokens.count(word)
+    return count
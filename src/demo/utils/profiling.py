@@ -1,23 +1,44 @@
+import cProfile
 import functools
+import os
+import pstats
+import sys
 from collections.abc import Callable
 from typing import Any
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _profiling_enabled() -> bool:
+    """Return whether ``DEMO_PROFILE`` is set to a truthy value (1/true/yes/on)."""
+    return os.getenv("DEMO_PROFILE", "").strip().lower() in _TRUTHY
+
 
 def profile[F: Callable[..., Any]](func: F) -> F:
-    """No-op profiling decorator for production use.
+    """Profiling decorator, a no-op unless ``DEMO_PROFILE`` is enabled.
 
-    In development/profiling environments, this would be replaced
-    with actual profiling instrumentation.
+    ``DEMO_PROFILE`` is read once, when the function is decorated (typically at
+    import time); changing it afterwards has no effect on decorated functions.
+    Without it the function is returned unchanged, so decorated calls pay no
+    wrapper overhead. With it set to 1/true/yes/on, each call runs under
+    ``cProfile`` and the top entries are printed to stderr.
 
     Args:
         func: Function to decorate
 
     Returns:
-        Original function unchanged
+        Original function, or a profiling wrapper when ``DEMO_PROFILE`` is enabled
     """
+    if not _profiling_enabled():
+        return func
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        return func(*args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(20)
 
     return wrapper  # type: ignore[return-value]
@@ -25,15 +25,10 @@ class TestSimpleTextProcessorProperties:
         tokens = processor.tokenize()
         count = processor.count_words()
 
-        # Calculate sum of frequencies for all unique tokens
-        if tokens:
-            unique_tokens = set(tokens)
-            frequency_sum = sum(
-                processor.word_frequency(token) for token in unique_tokens
-            )
-            assert frequency_sum == count
-        else:
-            assert count == 0
+        # Calculate sum of frequencies for all unique tokens; word_frequency
+        # reuses the processor's cached counts, so this stays O(N + U)
+        frequency_sum = sum(processor.word_frequency(token) for token in set(tokens))
+        assert frequency_sum == count
 
     @given(st.text())
     def test_preprocess_is_idempotent(self, text: str) -> None:
@@ -43,6 +43,35 @@ class TestCLI:
         finally:
             temp_path.unlink()
 
+    def test_count_command_with_empty_file_outputs_zero(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Edge case: count command on an empty file prints 0."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            temp_path = Path(f.name)
+
+        try:
+            result = main(["count", "--file", str(temp_path)])
+            assert result == 0
+            assert capsys.readouterr().out == "0\n"
+        finally:
+            temp_path.unlink()
+
+    def test_freq_command_with_file_outputs_frequency(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test freq command prints the word frequency read from a file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write("hello world\tworld\nworlds")
+            temp_path = Path(f.name)
+
+        try:
+            result = main(["freq", "world", "--file", str(temp_path)])
+            assert result == 0
+            assert capsys.readouterr().out == "2\n"
+        finally:
+            temp_path.unlink()
+
     def test_count_command_no_input_returns_error(self) -> None:
         """Test count command with no input returns error."""
         result = main(["count"])
@@ -0,0 +1,43 @@
+import pytest
+
+from demo.utils.profiling import profile
+
+
+def _add(a: int, b: int) -> int:
+    """Add two integers."""
+    return a + b
+
+
+class TestProfile:
+    """Unit tests for the profile decorator."""
+
+    @pytest.mark.parametrize("value", [None, "", "0", "false", "off"])
+    def test_profile_disabled_returns_function_unchanged(
+        self, monkeypatch: pytest.MonkeyPatch, value: str | None
+    ) -> None:
+        """Without a truthy DEMO_PROFILE the original function is returned."""
+        if value is None:
+            monkeypatch.delenv("DEMO_PROFILE", raising=False)
+        else:
+            monkeypatch.setenv("DEMO_PROFILE", value)
+        assert profile(_add) is _add
+
+    def test_profile_enabled_runs_function_and_prints_stats(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """With DEMO_PROFILE=1 the wrapper returns the result and writes stats."""
+        monkeypatch.setenv("DEMO_PROFILE", "1")
+        wrapped = profile(_add)
+        assert wrapped is not _add
+        assert wrapped(2, 3) == 5
+        assert "function calls" in capsys.readouterr().err
+
+    def test_profile_enabled_keeps_function_metadata(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The profiling wrapper keeps name/doc and links the original."""
+        monkeypatch.setenv("DEMO_PROFILE", "1")
+        wrapped = profile(_add)
+        assert wrapped.__name__ == "_add"
+        assert wrapped.__doc__ == "Add two integers."
+        assert wrapped.__wrapped__ is _add  # type: ignore[attr-defined]
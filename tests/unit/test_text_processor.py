@@ -1,6 +1,9 @@
+from pathlib import Path
+
 import pytest
 
-from demo import SimpleTextProcessor
+from demo import SimpleTextProcessor, count_file_tokens, iter_file_tokens
+from demo.core import text_processor
 
 
 class TestSimpleTextProcessor:
@@ -30,6 +33,21 @@ class TestSimpleTextProcessor:
         result = processor.tokenize()
         assert result == []
 
+    def test_tokenize_returns_independent_list_on_repeated_calls(self) -> None:
+        """Edge case: mutating a tokenize() result must not affect later calls."""
+        processor = SimpleTextProcessor("a b")
+        first = processor.tokenize()
+        first.append("c")
+        assert processor.tokenize() == ["a", "b"]
+        assert processor.count_words() == 2
+
+    def test_text_is_read_only(self) -> None:
+        """Error case: text cannot be reassigned after construction."""
+        processor = SimpleTextProcessor("a")
+        with pytest.raises(AttributeError):
+            processor.text = "b b"  # type: ignore[misc]
+        assert processor.text == "a"
+
     def test_count_words_returns_token_count(self) -> None:
         """UT-3: Word count - returns number of tokens."""
         processor = SimpleTextProcessor("a a b")
@@ -66,3 +84,28 @@ class TestSimpleTextProcessor:
         processor = SimpleTextProcessor("hello world")
         with pytest.raises(TypeError, match="Expected str, got NoneType"):
             processor.word_frequency(None)  # type: ignore[arg-type]
+
+    def test_iter_file_tokens_matches_tokenize(self, tmp_path: Path) -> None:
+        """File streaming yields the same tokens as tokenize, incl. Unicode spaces."""
+        text = "a  b\tc\n\u00a0d\x1ce  \u3000\u00fc "
+        path = tmp_path / "input.txt"
+        path.write_bytes(text.encode("utf-8"))
+        assert list(iter_file_tokens(path)) == SimpleTextProcessor(text).tokenize()
+
+    def test_iter_file_tokens_empty_file_yields_nothing(self, tmp_path: Path) -> None:
+        """Edge case: an empty file yields no tokens."""
+        path = tmp_path / "empty.txt"
+        path.touch()
+        assert list(iter_file_tokens(path)) == []
+
+    def test_file_tokens_span_chunk_boundaries(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Edge case: tokens cut by the chunk size are carried into the next read."""
+        monkeypatch.setattr(text_processor, "_CHUNK_SIZE", 4)
+        text = "spam\u00a0eggs  longwordwithoutspaces spam\x1fspam \u00fc\u00fc"
+        path = tmp_path / "input.txt"
+        path.write_bytes(text.encode("utf-8"))
+        assert list(iter_file_tokens(path)) == text.split()
+        assert count_file_tokens(path) == len(text.split())
+        assert count_file_tokens(path, "spam") == 3